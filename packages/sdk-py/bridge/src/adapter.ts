@@ -655,14 +655,20 @@ export class EvolveAdapter {
     return { path };
   }
 
-  async storageDownloadFiles(params: StorageClientDownloadFilesParams): Promise<{ files: EncodedFileMap }> {
+  async storageDownloadFiles(
+    params: StorageClientDownloadFilesParams
+  ): Promise<{ files: EncodedFileMap; all_text: boolean }> {
     const client = this.getStorageClient(params.storage);
     const files = await client.downloadFiles(params.id, {
       files: params.files,
       glob: params.glob,
       to: params.to,
     });
-    return { files: encodeFiles(files) };
+    // all_text lets the Python side skip per-file encoding checks
+    return {
+      files: encodeFiles(files),
+      all_text: Object.values(files).every((content) => typeof content === 'string'),
+    };
   }
 
   // ===========================================================================
@@ -1,17 +1,33 @@
 """Main Evolve class for Python SDK."""
 
 import asyncio
-import json
 from dataclasses import asdict, is_dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from .bridge import BridgeManager, SandboxNotFoundError
-from .config import AgentConfig, AgentPluginConfig, BrowserConfig, BrowserCredentialsConfig, IntegrationsSetup, ManagedSecretRef, SandboxProvider, SchemaOptions, StorageConfig, WorkspaceMode
+from .config import _BROWSER_PROVIDERS, AgentConfig, AgentPluginConfig, BrowserConfig, BrowserCredentialsConfig, IntegrationsSetup, ManagedSecretRef, SandboxProvider, SchemaOptions, StorageConfig, WorkspaceMode
 from .results import AgentResponse, CheckpointInfo, ExecuteResult, OutputResult, RunCost, SessionCost, SessionStatus
 from .storage_client import StorageClient
 from . import integrations as integrations_helpers
-from .schema import is_pydantic_model, is_dataclass, to_json_schema, validate_and_parse
-from .utils import _encode_files_for_transport, _decode_files_from_transport, _filter_none, _parse_checkpoint, _require_checkpoint
+from .schema import build_json_validator, is_dataclass, to_json_schema
+from .utils import _encode_files_for_transport, _decode_files_from_transport, _parse_checkpoint, _require_checkpoint
+
+
+# Optional AgentResponse fields forwarded from run / execute_command replies
+_RUN_RESPONSE_FIELDS = ('session_id', 'browser', 'run_id')
+_COMMAND_RESPONSE_FIELDS = ('session_id', 'browser')
+
+
+def _agent_response(response: Dict[str, Any], optional_fields: Tuple[str, ...], **extra: Any) -> AgentResponse:
+    """Build AgentResponse; missing required fields raise KeyError."""
+    return AgentResponse(
+        response['sandbox_id'],
+        response['exit_code'],
+        response['stdout'],
+        response['stderr'],
+        **{k: response[k] for k in optional_fields if k in response},
+        **extra,
+    )
 
 
 class Evolve:
@@ -47,6 +63,37 @@ class Evolve:
     # Static helpers for Integrations pre-auth flows (no instance required)
     integrations = integrations_helpers
 
+    # Fixed attribute set: no per-instance __dict__, slot access on RPC paths
+    __slots__ = (
+        'config',
+        'sandbox',
+        'working_directory',
+        'workspace_mode',
+        'system_prompt',
+        'context',
+        'files',
+        'mcp_servers',
+        'browser',
+        'browser_credentials',
+        'skills',
+        'secrets',
+        'managed_secrets',
+        'sandbox_id',
+        'session_tag_prefix',
+        'schema_options',
+        '_integrations',
+        '_storage_config',
+        'plugins',
+        '_schema',
+        '_schema_json',
+        '_schema_validator',
+        '_build_output',
+        'bridge',
+        '_initialized',
+        '_init_lock',
+        '__weakref__',
+    )
+
     def __init__(
         self,
         config: Optional[AgentConfig] = None,
@@ -122,6 +169,15 @@ class Evolve:
         # Schema handling: store original + convert to JSON Schema
         self._schema = schema
         self._schema_json = to_json_schema(schema)
+        # Pydantic model / dataclass validator, resolved once per instance
+        self._schema_validator = build_json_validator(schema)
+        # get_output_files() result builder, dispatched once on schema kind
+        if self._schema_json is None:
+            self._build_output = self._output_without_schema
+        elif self._schema_validator is None:
+            self._build_output = self._output_from_ts_validation
+        else:
+            self._build_output = self._output_from_python_validation
 
         self.bridge = BridgeManager()
         self._initialized = False
@@ -135,46 +191,57 @@ class Evolve:
 
             await self.bridge.start()
 
-            # Build params with _filter_none to exclude None values
-            # TS SDK resolves defaults from env vars when not provided
-            params = _filter_none({
-                # Agent config (optional - TS SDK resolves from env vars)
-                'agent_type': self.config.type if self.config else None,
-                'api_key': self.config.api_key if self.config else None,
-                'provider_api_key': self.config.provider_api_key if self.config else None,
-                'oauth_token': self.config.oauth_token if self.config else None,
-                'provider_base_url': self.config.provider_base_url if self.config else None,
-                'model': self.config.model if self.config else None,
-                'reasoning_effort': self.config.reasoning_effort if self.config else None,
-                # Sandbox (optional - TS SDK auto-resolves from EVOLVE_API_KEY/E2B_API_KEY/DAYTONA_API_KEY)
-                'sandbox_provider': {'type': self.sandbox.type, 'config': self.sandbox.config} if self.sandbox else None,
-                # Other settings
-                'working_directory': self.working_directory,
-                'workspace_mode': self.workspace_mode,
-                'system_prompt': self.system_prompt,
-                'context': _encode_files_for_transport(self.context) if self.context else None,
-                'files': _encode_files_for_transport(self.files) if self.files else None,
-                'mcp_servers': self.mcp_servers,
-                'browser': self.browser,
-                'browser_credentials': self.browser_credentials.to_dict() if self.browser_credentials else None,
-                'plugins': self.plugins,
-                'skills': self.skills,
-                'secrets': self.secrets,
-                'managed_secrets': self.managed_secrets,
-                'sandbox_id': self.sandbox_id,
-                'session_tag_prefix': self.session_tag_prefix,
-                'schema': self._schema_json,
-                'schema_options': {'mode': self.schema_options.mode} if self._schema_json else None,
-                # Managed integrations
-                'integrations': self._integrations.to_dict() if self._integrations else None,
-                # Storage / Checkpointing
-                'storage': self._storage_config.to_dict() if self._storage_config else None,
-                # Always forward events
-                'forward_stdout': True,
-                'forward_stderr': True,
-                'forward_content': True,
-                'forward_lifecycle': True,
-            })
+            # Add keys conditionally so None values are never sent.
+            # TS SDK resolves defaults from env vars when not provided.
+            # Agent config (optional - TS SDK resolves from env vars)
+            params: Dict[str, Any] = self.config.to_dict() if self.config is not None else {}
+            # Sandbox (optional - TS SDK auto-resolves from EVOLVE_API_KEY/E2B_API_KEY/DAYTONA_API_KEY)
+            if self.sandbox:
+                params['sandbox_provider'] = {'type': self.sandbox.type, 'config': self.sandbox.config}
+            # Other settings
+            if self.working_directory is not None:
+                params['working_directory'] = self.working_directory
+            if self.workspace_mode is not None:
+                params['workspace_mode'] = self.workspace_mode
+            if self.system_prompt is not None:
+                params['system_prompt'] = self.system_prompt
+            if self.context:
+                params['context'] = _encode_files_for_transport(self.context)
+            if self.files:
+                params['files'] = _encode_files_for_transport(self.files)
+            if self.mcp_servers is not None:
+                params['mcp_servers'] = self.mcp_servers
+            if self.browser is not None:
+                params['browser'] = self.browser
+            if self.browser_credentials:
+                params['browser_credentials'] = self.browser_credentials.to_dict()
+            if self.plugins is not None:
+                params['plugins'] = self.plugins
+            if self.skills is not None:
+                params['skills'] = self.skills
+            if self.secrets is not None:
+                params['secrets'] = self.secrets
+            if self.managed_secrets is not None:
+                params['managed_secrets'] = self.managed_secrets
+            if self.sandbox_id is not None:
+                params['sandbox_id'] = self.sandbox_id
+            if self.session_tag_prefix is not None:
+                params['session_tag_prefix'] = self.session_tag_prefix
+            if self._schema_json is not None:
+                params['schema'] = self._schema_json
+            if self._schema_json:
+                params['schema_options'] = {'mode': self.schema_options.mode}
+            # Managed integrations
+            if self._integrations:
+                params['integrations'] = self._integrations.to_dict()
+            # Storage / Checkpointing
+            if self._storage_config:
+                params['storage'] = self._storage_config.to_dict()
+            # Always forward events
+            params['forward_stdout'] = True
+            params['forward_stderr'] = True
+            params['forward_content'] = True
+            params['forward_lifecycle'] = True
 
             await self.bridge.call('initialize', params, timeout_s=self._get_rpc_timeout_s(None))
             self._initialized = True
@@ -184,7 +251,7 @@ class Evolve:
         """Normalize browser automation shorthand for bridge transport."""
         if browser is None:
             return None
-        if browser in ('browser-use', 'actionbook', 'agent-browser'):
+        if isinstance(browser, str) and browser in _BROWSER_PROVIDERS:
             return browser
         if isinstance(browser, dict):
             provider = browser.get('provider', 'agent-browser')
@@ -334,14 +401,9 @@ class Evolve:
             timeout_s=self._get_rpc_timeout_s(timeout_ms),
         )
 
-        return AgentResponse(
-            sandbox_id=response['sandbox_id'],
-            exit_code=response['exit_code'],
-            stdout=response['stdout'],
-            stderr=response['stderr'],
-            session_id=response.get('session_id'),
-            browser=response.get('browser'),
-            run_id=response.get('run_id'),
+        return _agent_response(
+            response,
+            _RUN_RESPONSE_FIELDS,
             checkpoint=_parse_checkpoint(response.get('checkpoint')),
         )
 
@@ -378,14 +440,7 @@ class Evolve:
             timeout_s=self._get_rpc_timeout_s(timeout_ms),
         )
 
-        return AgentResponse(
-            sandbox_id=response['sandbox_id'],
-            exit_code=response['exit_code'],
-            stdout=response['stdout'],
-            stderr=response['stderr'],
-            session_id=response.get('session_id'),
-            browser=response.get('browser'),
-        )
+        return _agent_response(response, _COMMAND_RESPONSE_FIELDS)
 
     async def upload_context(
         self,
@@ -462,41 +517,41 @@ class Evolve:
 
         files = _decode_files_from_transport(response.get('files', {}))
 
-        data = None
-        error = None
-        raw_data = None
-
-        # CASE 1: Pydantic model or dataclass → Native Python validation
-        if is_pydantic_model(self._schema) or is_dataclass(self._schema):
-            raw_json = files.get('result.json')
-            if raw_json is None:
-                error = "Schema provided but agent did not create output/result.json"
-            else:
-                if isinstance(raw_json, bytes):
-                    raw_json = raw_json.decode('utf-8')
-
-                try:
-                    strict = self.schema_options.mode == 'strict'
-                    data = validate_and_parse(raw_json, self._schema, strict=strict)
-                except Exception as e:
-                    error = f"Schema validation failed: {e}"
-                    raw_data = raw_json
+        return self._build_output(files, response)
 
-        # CASE 2: JSON Schema dict → Use TS validation (backward compatible)
-        elif self._schema_json is not None:
-            data = response.get('data')
-            error = response.get('error')
-            raw_data = response.get('raw_data')
-
-        # CASE 3: No schema → Just return files (data stays None)
+    def _output_without_schema(self, files: Dict[str, Union[str, bytes]], response: Dict[str, Any]) -> OutputResult:
+        """No schema → just return files (data stays None)."""
+        return OutputResult(files=files)
 
+    def _output_from_ts_validation(self, files: Dict[str, Union[str, bytes]], response: Dict[str, Any]) -> OutputResult:
+        """JSON Schema dict → Use TS validation (backward compatible)."""
         return OutputResult(
             files=files,
-            data=data,
-            error=error,
-            raw_data=raw_data,
+            data=response.get('data'),
+            error=response.get('error'),
+            raw_data=response.get('raw_data'),
         )
 
+    def _output_from_python_validation(self, files: Dict[str, Union[str, bytes]], response: Dict[str, Any]) -> OutputResult:
+        """Pydantic model or dataclass → Native Python validation."""
+        raw_json = files.get('result.json')
+        if raw_json is None:
+            return OutputResult(
+                files=files,
+                error="Schema provided but agent did not create output/result.json",
+            )
+
+        # Validators parse str or bytes natively — no upfront decode
+        try:
+            strict = self.schema_options.mode == 'strict'
+            return OutputResult(files=files, data=self._schema_validator(raw_json, strict=strict))
+        except Exception as e:
+            return OutputResult(
+                files=files,
+                error=f"Schema validation failed: {e}",
+                raw_data=raw_json.decode('utf-8', errors='replace') if isinstance(raw_json, bytes) else raw_json,
+            )
+
     # =========================================================================
     # STORAGE / CHECKPOINTING
     # =========================================================================
@@ -551,7 +606,7 @@ class Evolve:
         if tag is not None:
             params['tag'] = tag
         response = await self.bridge.call('list_checkpoints', params, timeout_s=self._get_rpc_timeout_s(None))
-        return [_require_checkpoint(cp) for cp in response]
+        return list(map(_require_checkpoint, response))
 
     def storage(self) -> StorageClient:
         """Get a StorageClient bound to this instance's storage configuration.
@@ -624,16 +679,7 @@ class Evolve:
     async def status(self) -> SessionStatus:
         """Get runtime status snapshot for sandbox and agent."""
         await self._ensure_initialized()
-        response = await self.bridge.call('status')
-        return SessionStatus(
-            sandbox_id=response.get('sandbox_id'),
-            sandbox=response.get('sandbox', 'stopped'),
-            agent=response.get('agent', 'idle'),
-            active_process_id=response.get('active_process_id'),
-            has_run=bool(response.get('has_run', False)),
-            timestamp=response.get('timestamp', ''),
-            browser=response.get('browser'),
-        )
+        return SessionStatus.from_dict(await self.bridge.call('status'))
 
     async def resume(self):
         """Resume paused sandbox.
@@ -9,6 +9,11 @@ import signal
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+try:
+    import orjson  # Optional: faster frame codec (pip install evolve-sdk[fast])
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,22 @@ def _atexit_cleanup():
 atexit.register(_atexit_cleanup)
 
 
+def _encode_frame_payload(obj: Any) -> bytes:
+    """Serialize a JSON-RPC message to UTF-8 JSON bytes (compact separators)."""
+    if orjson is not None:
+        # NON_STR_KEYS matches json.dumps, which stringifies int/float keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Both accept the raw UTF-8 frame bytes
+_decode_frame_payload: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Path of the bridge script, cached after the first BridgeManager.start()
+# so standalone clients that spin up a bridge per call skip the lookup
+_bridge_script: Optional[str] = None
+
+
 class SandboxNotFoundError(Exception):
     """Raised when sandbox is not found (expired or killed)."""
     pass
@@ -84,21 +105,11 @@ class BridgeManager:
         if self.process is not None:
             return
 
-        # Find bridge script (bundled version for distribution)
-        bridge_dir = Path(__file__).parent.parent / 'bridge'
-        bridge_script = bridge_dir / 'dist' / 'bridge.bundle.cjs'
-
-        # Fallback to unbundled version for development
-        if not bridge_script.exists():
-            bridge_script = bridge_dir / 'dist' / 'bridge.js'
-
-        # Auto-build bridge if missing (turnkey experience)
-        if not bridge_script.exists():
-            await self._build_bridge(bridge_dir)
+        bridge_script = await self._resolve_bridge_script()
 
         # Start Node.js process with native asyncio subprocess
         self.process = await asyncio.create_subprocess_exec(
-            'node', str(bridge_script),
+            'node', bridge_script,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
@@ -114,6 +125,27 @@ class BridgeManager:
         if self.process.stderr is not None:
             self.stderr_task = asyncio.create_task(self._drain_stderr())
 
+    async def _resolve_bridge_script(self) -> str:
+        """Locate (building if needed) the bridge script; resolved once per process."""
+        global _bridge_script
+        if _bridge_script is not None:
+            return _bridge_script
+
+        # Find bridge script (bundled version for distribution)
+        bridge_dir = Path(__file__).parent.parent / 'bridge'
+        bridge_script = bridge_dir / 'dist' / 'bridge.bundle.cjs'
+
+        # Fallback to unbundled version for development
+        if not bridge_script.exists():
+            bridge_script = bridge_dir / 'dist' / 'bridge.js'
+
+        # Auto-build bridge if missing (turnkey experience)
+        if not bridge_script.exists():
+            await self._build_bridge(bridge_dir)
+
+        _bridge_script = str(bridge_script)
+        return _bridge_script
+
     async def _build_bridge(self, bridge_dir: Path):
         """Build the bridge if missing (first run experience)."""
         import shutil
@@ -136,32 +168,22 @@ class BridgeManager:
 
         logger.info("First run: building Node.js bridge...")
         try:
-            # Run npm install/build in executor to avoid blocking event loop
-            loop = asyncio.get_running_loop()
-
-            # Install dependencies
-            await loop.run_in_executor(
-                None,
-                lambda: subprocess.run(
-                    ['npm', 'install'],
-                    cwd=bridge_dir,
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-            )
-
-            # Build bridge
-            await loop.run_in_executor(
-                None,
-                lambda: subprocess.run(
-                    ['npm', 'run', 'build'],
+            # npm runs as a native asyncio subprocess - no executor thread needed
+            for args in (['npm', 'install'], ['npm', 'run', 'build']):
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
                     cwd=bridge_dir,
-                    check=True,
-                    capture_output=True,
-                    text=True
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
-            )
+                stdout, stderr = await proc.communicate()
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode,
+                        args,
+                        output=stdout.decode('utf-8', errors='replace'),
+                        stderr=stderr.decode('utf-8', errors='replace'),
+                    )
             logger.info("Bridge built successfully")
         except subprocess.CalledProcessError as e:
             raise BridgeBuildError(
@@ -189,21 +211,13 @@ class BridgeManager:
         if self._pid and self._pid in _bridge_pids:
             _bridge_pids.remove(self._pid)
 
-        # Cancel reader tasks first (they will exit cleanly now that process is terminating)
-        if self.reader_task:
-            self.reader_task.cancel()
-            try:
-                await self.reader_task
-            except asyncio.CancelledError:
-                pass
-
-        if self.stderr_task:
-            self.stderr_task.cancel()
-            try:
-                await self.stderr_task
-            except asyncio.CancelledError:
-                pass
-            self.stderr_task = None
+        # Cancel reader tasks first (they will exit cleanly now that process is terminating).
+        # Both are cancelled up front and awaited together rather than one after the other.
+        readers = [task for task in (self.reader_task, self.stderr_task) if task is not None]
+        for task in readers:
+            task.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
+        self.stderr_task = None
 
         # Terminate process
         try:
@@ -262,7 +276,7 @@ class BridgeManager:
             self.pending_requests[request_id] = future
 
             # Send request (native async write)
-            payload = json.dumps(request).encode('utf-8')
+            payload = _encode_frame_payload(request)
             frame = len(payload).to_bytes(4, byteorder='big') + payload
             self.process.stdin.write(frame)
             await self.process.stdin.drain()
@@ -300,35 +314,26 @@ class BridgeManager:
         # stdout/stderr events or fetching files individually.
         max_frame_bytes = 50 * 1024 * 1024
 
+        stdout = self.process.stdout
         try:
-            async def read_exact(n: int) -> Optional[bytes]:
-                """Read exactly n bytes from stdout."""
-                chunks: List[bytes] = []
-                remaining = n
-                while remaining > 0:
-                    chunk = await self.process.stdout.read(remaining)
-                    if not chunk:
-                        return None
-                    chunks.append(chunk)
-                    remaining -= len(chunk)
-                return b"".join(chunks)
-
             while True:
-                header = await read_exact(4)
-                if not header:
+                # readexactly() fills one buffer per frame; EOF mid-frame ends the loop
+                try:
+                    header = await stdout.readexactly(4)
+                except asyncio.IncompleteReadError:
                     break
                 length = int.from_bytes(header, byteorder='big')
                 if length <= 0 or length > max_frame_bytes:
                     logger.error(f"Invalid frame length from bridge: {length}")
                     break
 
-                payload = await read_exact(length)
-                if payload is None:
+                try:
+                    payload = await stdout.readexactly(length)
+                except asyncio.IncompleteReadError:
                     break
 
                 try:
-                    text = payload.decode('utf-8')
-                    message = json.loads(text)
+                    message = _decode_frame_payload(payload)
                 except Exception:
                     logger.exception("Failed to parse bridge frame")
                     continue
@@ -363,10 +368,10 @@ class BridgeManager:
                 line = await self.process.stderr.readline()
                 if not line:
                     break
-                try:
-                    text = line.decode("utf-8", errors="ignore").rstrip()
-                except Exception:
-                    text = str(line).rstrip()
+                # Lines are only logged at DEBUG; skip decoding when nobody is listening
+                if not logger.isEnabledFor(logging.DEBUG):
+                    continue
+                text = line.decode("utf-8", errors="ignore").rstrip()
                 if text:
                     logger.debug(f"[bridge stderr] {text}")
         except asyncio.CancelledError:
@@ -377,7 +382,7 @@ class BridgeManager:
     def _handle_event(self, params: Dict[str, Any]):
         """Handle event notification from bridge."""
         event_type = params.get('type')
-        callbacks = self.event_callbacks.get(event_type, [])
+        callbacks = self.event_callbacks.get(event_type, ())
 
         if event_type in ('stdout', 'stderr'):
             data = params.get('data', '')
@@ -6,9 +6,7 @@ import hashlib
 import json
 import os
 import secrets
-import urllib.error
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -157,6 +155,10 @@ class BrowserCredentialsClient:
         method: str,
         body: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
+        # Deferred: urllib.request pulls in http.client/ssl/email at import time
+        import urllib.error
+        import urllib.request
+
         data = json.dumps(body).encode('utf-8') if body is not None else None
         headers = {
             'Authorization': f'Bearer {_resolve_api_key(self.config)}',
@@ -255,7 +257,9 @@ def _mgf1(seed: bytes, length: int) -> bytes:
 
 
 def _xor_bytes(left: bytes, right: bytes) -> bytes:
-    return bytes(a ^ b for a, b in zip(left, right))
+    # One big-int XOR instead of a per-byte generator; callers pass equal lengths
+    length = len(left)
+    return (int.from_bytes(left, 'big') ^ int.from_bytes(right, 'big')).to_bytes(length, 'big')
 
 
 def _rsa_oaep_sha256_encrypt(public_key_pem: str, plaintext: bytes) -> bytes:
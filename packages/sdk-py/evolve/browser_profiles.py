@@ -3,9 +3,7 @@
 import asyncio
 import json
 import os
-import urllib.error
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -85,6 +83,10 @@ class BrowserProfilesClient:
         method: str,
         body: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
+        # Deferred: urllib.request pulls in http.client/ssl/email at import time
+        import urllib.error
+        import urllib.request
+
         data = json.dumps(body).encode('utf-8') if body is not None else None
         headers = {
             'Authorization': f'Bearer {_resolve_api_key(self.config)}',
@@ -1,7 +1,7 @@
 """Configuration types for Evolve SDK."""
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Protocol, TypedDict, Union, runtime_checkable
+from typing import Any, Dict, List, Literal, Optional, Protocol, Tuple, TypedDict, Union, get_args, runtime_checkable
 
 
 AgentType = Literal['codex', 'claude', 'gemini', 'qwen', 'kimi', 'opencode', 'droid']
@@ -12,8 +12,16 @@ AgentPluginConfig = Dict[str, Any]
 ReasoningEffort = Literal['off', 'minimal', 'low', 'medium', 'high', 'xhigh', 'max', 'thinking', 'no-thinking']
 ValidationMode = Literal['strict', 'loose']
 
+# Shorthand browser providers as a set, for O(1) runtime membership checks
+_BROWSER_PROVIDERS = frozenset(get_args(BrowserProvider))
 
-@dataclass
+
+def _truthy_fields(obj: Any, field_map: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Map truthy attributes of *obj* to transport keys per (attr, key) pairs."""
+    return {key: value for attr, key in field_map if (value := getattr(obj, attr))}
+
+
+@dataclass(slots=True)
 class SchemaOptions:
     """Validation options for schema validation.
 
@@ -23,7 +31,7 @@ class SchemaOptions:
     mode: ValidationMode = 'loose'
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserCredentialScopeEntry:
     """Saved browser login selector for a run.
 
@@ -35,13 +43,12 @@ class BrowserCredentialScopeEntry:
     account_label: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {'website': self.website}
         if self.account_label:
-            result['account_label'] = self.account_label
-        return result
+            return {'website': self.website, 'account_label': self.account_label}
+        return {'website': self.website}
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserCredentialsConfig:
     """Browser login MCP configuration for managed remote agent-browser runs.
 
@@ -60,7 +67,14 @@ class BrowserCredentialsConfig:
         return result
 
 
-@dataclass
+# Standalone dashboard client configs (browser credentials/profiles)
+_CLIENT_CONFIG_FIELDS = (
+    ('api_key', 'api_key'),
+    ('dashboard_url', 'dashboard_url'),
+)
+
+
+@dataclass(slots=True)
 class BrowserCredentialsClientConfig:
     """Standalone browser credentials client configuration.
 
@@ -72,15 +86,10 @@ class BrowserCredentialsClientConfig:
     dashboard_url: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {}
-        if self.api_key:
-            result['api_key'] = self.api_key
-        if self.dashboard_url:
-            result['dashboard_url'] = self.dashboard_url
-        return result
+        return _truthy_fields(self, _CLIENT_CONFIG_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserProfilesClientConfig:
     """Standalone browser profiles client configuration.
 
@@ -92,15 +101,10 @@ class BrowserProfilesClientConfig:
     dashboard_url: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {}
-        if self.api_key:
-            result['api_key'] = self.api_key
-        if self.dashboard_url:
-            result['dashboard_url'] = self.dashboard_url
-        return result
+        return _truthy_fields(self, _CLIENT_CONFIG_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedSecretRef:
     """Dashboard-stored managed secret to expose as an opaque sandbox env var.
 
@@ -112,13 +116,12 @@ class ManagedSecretRef:
     as_name: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {'name': self.name}
         if self.as_name:
-            result['as'] = self.as_name
-        return result
+            return {'name': self.name, 'as': self.as_name}
+        return {'name': self.name}
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedSecretsClientConfig:
     """Standalone managed secrets client configuration.
 
@@ -130,7 +133,19 @@ class ManagedSecretsClientConfig:
     dashboard_url: Optional[str] = None
 
 
-@dataclass
+# AgentConfig attribute -> bridge initialize param
+_AGENT_CONFIG_FIELDS = (
+    ('type', 'agent_type'),
+    ('api_key', 'api_key'),
+    ('provider_api_key', 'provider_api_key'),
+    ('oauth_token', 'oauth_token'),
+    ('provider_base_url', 'provider_base_url'),
+    ('model', 'model'),
+    ('reasoning_effort', 'reasoning_effort'),
+)
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """Agent configuration.
 
@@ -158,6 +173,14 @@ class AgentConfig:
     model: Optional[str] = None
     reasoning_effort: Optional[ReasoningEffort] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to bridge initialize params (None fields omitted)."""
+        return {
+            key: value
+            for attr, key in _AGENT_CONFIG_FIELDS
+            if (value := getattr(self, attr)) is not None
+        }
+
 
 @runtime_checkable
 class SandboxProvider(Protocol):
@@ -182,7 +205,30 @@ class SandboxProvider(Protocol):
         ...
 
 
-@dataclass
+# Provider dataclass attribute -> bridge config key
+_E2B_CONFIG_FIELDS = (
+    ('api_key', 'apiKey'),
+    ('timeout_ms', 'defaultTimeoutMs'),
+    ('template_id', 'templateId'),
+)
+_DAYTONA_CONFIG_FIELDS = (
+    ('api_key', 'apiKey'),
+    ('api_url', 'apiUrl'),
+    ('target', 'target'),
+    ('timeout_ms', 'defaultTimeoutMs'),
+    ('snapshot_name', 'snapshotName'),
+)
+_MODAL_CONFIG_FIELDS = (
+    ('app_name', 'appName'),
+    ('timeout_ms', 'defaultTimeoutMs'),
+    ('token_id', 'tokenId'),
+    ('token_secret', 'tokenSecret'),
+    ('endpoint', 'endpoint'),
+    ('image_name', 'imageName'),
+)
+
+
+@dataclass(slots=True)
 class E2BProvider:
     """E2B sandbox provider configuration.
 
@@ -203,17 +249,10 @@ class E2BProvider:
     @property
     def config(self) -> dict:
         """Provider configuration dict."""
-        result = {}
-        if self.api_key:
-            result['apiKey'] = self.api_key
-        if self.timeout_ms:
-            result['defaultTimeoutMs'] = self.timeout_ms
-        if self.template_id:
-            result['templateId'] = self.template_id
-        return result
+        return _truthy_fields(self, _E2B_CONFIG_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class DaytonaProvider:
     """Daytona sandbox provider configuration.
 
@@ -238,21 +277,10 @@ class DaytonaProvider:
     @property
     def config(self) -> dict:
         """Provider configuration dict."""
-        result = {}
-        if self.api_key:
-            result['apiKey'] = self.api_key
-        if self.api_url:
-            result['apiUrl'] = self.api_url
-        if self.target:
-            result['target'] = self.target
-        if self.timeout_ms:
-            result['defaultTimeoutMs'] = self.timeout_ms
-        if self.snapshot_name:
-            result['snapshotName'] = self.snapshot_name
-        return result
+        return _truthy_fields(self, _DAYTONA_CONFIG_FIELDS)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModalProvider:
     """Modal sandbox provider configuration.
 
@@ -279,20 +307,7 @@ class ModalProvider:
     @property
     def config(self) -> dict:
         """Provider configuration dict."""
-        result = {}
-        if self.app_name:
-            result['appName'] = self.app_name
-        if self.timeout_ms:
-            result['defaultTimeoutMs'] = self.timeout_ms
-        if self.token_id:
-            result['tokenId'] = self.token_id
-        if self.token_secret:
-            result['tokenSecret'] = self.token_secret
-        if self.endpoint:
-            result['endpoint'] = self.endpoint
-        if self.image_name:
-            result['imageName'] = self.image_name
-        return result
+        return _truthy_fields(self, _MODAL_CONFIG_FIELDS)
 
 
 # =============================================================================
@@ -300,7 +315,7 @@ class ModalProvider:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageCredentials:
     """S3 credentials for BYOK storage.
 
@@ -312,7 +327,16 @@ class StorageCredentials:
     secret_access_key: str
 
 
-@dataclass
+_STORAGE_CONFIG_FIELDS = (
+    ('url', 'url'),
+    ('bucket', 'bucket'),
+    ('prefix', 'prefix'),
+    ('region', 'region'),
+    ('endpoint', 'endpoint'),
+)
+
+
+@dataclass(slots=True)
 class StorageConfig:
     """Storage configuration for checkpoint persistence.
 
@@ -337,17 +361,7 @@ class StorageConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON-RPC transport."""
-        result: Dict[str, Any] = {}
-        if self.url:
-            result['url'] = self.url
-        if self.bucket:
-            result['bucket'] = self.bucket
-        if self.prefix:
-            result['prefix'] = self.prefix
-        if self.region:
-            result['region'] = self.region
-        if self.endpoint:
-            result['endpoint'] = self.endpoint
+        result = _truthy_fields(self, _STORAGE_CONFIG_FIELDS)
         if self.credentials:
             result['credentials'] = {
                 'accessKeyId': self.credentials.access_key_id,
@@ -356,7 +370,13 @@ class StorageConfig:
         return result
 
 
-@dataclass
+_SESSIONS_CONFIG_FIELDS = (
+    ('api_key', 'apiKey'),
+    ('dashboard_url', 'dashboardUrl'),
+)
+
+
+@dataclass(slots=True)
 class SessionsConfig:
     """Configuration for the standalone sessions() client.
 
@@ -372,12 +392,7 @@ class SessionsConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON-RPC transport."""
-        result: Dict[str, Any] = {}
-        if self.api_key:
-            result['apiKey'] = self.api_key
-        if self.dashboard_url:
-            result['dashboardUrl'] = self.dashboard_url
-        return result
+        return _truthy_fields(self, _SESSIONS_CONFIG_FIELDS)
 
 
 # =============================================================================
@@ -404,7 +419,16 @@ class TagsFilter(TypedDict):
 IntegrationToolsFilter = Union[List[str], EnableFilter, DisableFilter, TagsFilter]
 
 
-@dataclass(kw_only=True)
+# Optional fields shared by IntegrationsConfig and IntegrationsSetup
+_INTEGRATIONS_OPTIONAL_FIELDS = (
+    ('tools', 'tools'),
+    ('accounts', 'accounts'),
+    ('keys', 'keys'),
+    ('auth_configs', 'auth_configs'),
+)
+
+
+@dataclass(kw_only=True, slots=True)
 class IntegrationsConfig:
     """Managed integrations configuration.
 
@@ -423,19 +447,10 @@ class IntegrationsConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON-RPC transport."""
-        result: Dict[str, Any] = {'apps': self.apps}
-        if self.tools:
-            result['tools'] = self.tools
-        if self.accounts:
-            result['accounts'] = self.accounts
-        if self.keys:
-            result['keys'] = self.keys
-        if self.auth_configs:
-            result['auth_configs'] = self.auth_configs
-        return result
+        return {'apps': self.apps, **_truthy_fields(self, _INTEGRATIONS_OPTIONAL_FIELDS)}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class IntegrationsSetup:
     """Managed integrations setup.
 
@@ -457,13 +472,8 @@ class IntegrationsSetup:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON-RPC transport."""
-        result: Dict[str, Any] = {'user_id': self.user_id, 'apps': self.apps}
-        if self.tools:
-            result['tools'] = self.tools
-        if self.accounts:
-            result['accounts'] = self.accounts
-        if self.keys:
-            result['keys'] = self.keys
-        if self.auth_configs:
-            result['auth_configs'] = self.auth_configs
-        return result
+        return {
+            'user_id': self.user_id,
+            'apps': self.apps,
+            **_truthy_fields(self, _INTEGRATIONS_OPTIONAL_FIELDS),
+        }
@@ -3,8 +3,6 @@
 import asyncio
 import json
 import os
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -62,6 +60,10 @@ class ManagedSecretsClient:
         return await asyncio.to_thread(self._request_json_sync, path)
 
     def _request_json_sync(self, path: str) -> Dict[str, Any]:
+        # Deferred: urllib.request pulls in http.client/ssl/email at import time
+        import urllib.error
+        import urllib.request
+
         request = urllib.request.Request(
             f'{_dashboard_base_url(self.config)}{path}',
             headers={
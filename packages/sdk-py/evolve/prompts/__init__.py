@@ -4,6 +4,7 @@ Prompts are stored as markdown files for easy editing.
 They are loaded at import time using importlib.resources.
 """
 
+import re
 from importlib import resources
 from typing import Dict, Union
 
@@ -24,10 +25,14 @@ VERIFY_USER_PROMPT: str = _load_prompt('user', 'verify.md')
 RETRY_FEEDBACK_PROMPT: str = _load_prompt('user', 'retry_feedback.md')
 
 
+_PLACEHOLDER = re.compile(r'\{\{([^{}]+)\}\}')
+
+
 def apply_template(template: str, variables: Dict[str, str]) -> str:
     """Apply template variables to a template string.
 
     Replaces {{variable}} with the corresponding value from variables dict.
+    Placeholders without a matching variable are left as-is.
 
     Args:
         template: Template string with {{variable}} placeholders
@@ -36,10 +41,10 @@ def apply_template(template: str, variables: Dict[str, str]) -> str:
     Returns:
         Template with placeholders replaced
     """
-    result = template
-    for key, value in variables.items():
-        result = result.replace(f"{{{{{key}}}}}", value)
-    return result
+    if not variables:
+        return template
+    # Single pass: substituted values are never rescanned for placeholders
+    return _PLACEHOLDER.sub(lambda m: variables.get(m.group(1), m.group(0)), template)
 
 
 def build_file_tree(files: Dict[str, Union[str, bytes]]) -> str:
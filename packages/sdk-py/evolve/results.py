@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckpointInfo:
     """Checkpoint metadata.
 
@@ -35,7 +35,7 @@ class CheckpointInfo:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Response from agent execution.
 
@@ -65,7 +65,7 @@ class AgentResponse:
 ExecuteResult = AgentResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStatus:
     """Runtime status snapshot for sandbox and agent."""
     sandbox_id: Optional[str]
@@ -76,8 +76,29 @@ class SessionStatus:
     timestamp: str
     browser: Optional[Dict[str, str]] = None
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionStatus':
+        """Build from a bridge ``status`` response, filling missing fields with defaults."""
+        merged = {**_SESSION_STATUS_DEFAULTS, **data}
+        if merged.keys() != _SESSION_STATUS_DEFAULTS.keys():
+            # Tolerate fields added by newer bridges
+            merged = {k: merged[k] for k in _SESSION_STATUS_DEFAULTS}
+        merged['has_run'] = bool(merged['has_run'])
+        return cls(**merged)
+
+
+_SESSION_STATUS_DEFAULTS: Dict[str, Any] = {
+    'sandbox_id': None,
+    'sandbox': 'stopped',
+    'agent': 'idle',
+    'active_process_id': None,
+    'has_run': False,
+    'timestamp': '',
+    'browser': None,
+}
+
+
+@dataclass(slots=True)
 class OutputResult:
     """Result from get_output_files() with optional schema validation.
 
@@ -96,7 +117,7 @@ class OutputResult:
     raw_data: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunCost:
     """Cost breakdown for a single run() invocation.
 
@@ -124,7 +145,7 @@ class RunCost:
     truncated: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCost:
     """Cost breakdown for an entire agent session (all runs).
 
@@ -151,7 +172,7 @@ class SessionCost:
 SessionEvent = Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Historical session metadata from the standalone sessions() client.
 
@@ -173,7 +194,7 @@ class SessionInfo:
     tool_stats: Optional[Dict[str, int]]
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPage:
     """Paginated session list response from the standalone sessions() client."""
     items: List[SessionInfo]
@@ -181,7 +202,7 @@ class SessionPage:
     has_more: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserReplay:
     """Browser replay metadata and Dashboard-owned access URLs."""
     session_id: str
@@ -5,7 +5,8 @@ Uses Pydantic's TypeAdapter for dataclass support.
 """
 
 import dataclasses
-from typing import Any, Dict, Optional
+import weakref
+from typing import Any, Callable, Dict, Optional, Union
 
 
 # =============================================================================
@@ -37,6 +38,11 @@ def is_json_schema(obj: Any) -> bool:
 # =============================================================================
 
 
+# Generated JSON Schema per model/dataclass type. Weak keys so dynamically
+# created classes are not kept alive by the cache.
+_JSON_SCHEMA_CACHE: 'weakref.WeakKeyDictionary[type, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+
+
 def to_json_schema(schema: Any) -> Optional[Dict[str, Any]]:
     """Convert a schema to JSON Schema format.
 
@@ -45,6 +51,8 @@ def to_json_schema(schema: Any) -> Optional[Dict[str, Any]]:
     - Pydantic models - uses model_json_schema()
     - Dataclasses - uses Pydantic TypeAdapter
 
+    Generated schemas are cached per type; treat the result as read-only.
+
     Args:
         schema: Pydantic model, dataclass, or JSON Schema dict
 
@@ -57,12 +65,20 @@ def to_json_schema(schema: Any) -> Optional[Dict[str, Any]]:
     if is_json_schema(schema):
         return schema
 
+    cached = _JSON_SCHEMA_CACHE.get(schema) if isinstance(schema, type) else None
+    if cached is not None:
+        return cached
+
     if is_pydantic_model(schema):
-        return schema.model_json_schema()
+        json_schema = schema.model_json_schema()
+        _JSON_SCHEMA_CACHE[schema] = json_schema
+        return json_schema
 
     if is_dataclass(schema):
         from pydantic import TypeAdapter
-        return TypeAdapter(schema).json_schema()
+        json_schema = TypeAdapter(schema).json_schema()
+        _JSON_SCHEMA_CACHE[schema] = json_schema
+        return json_schema
 
     raise TypeError(
         f"Schema must be a Pydantic model, dataclass, or dict. "
@@ -75,15 +91,46 @@ def to_json_schema(schema: Any) -> Optional[Dict[str, Any]]:
 # =============================================================================
 
 
+def build_json_validator(schema: Any) -> Optional[Callable[..., Any]]:
+    """Build a reusable JSON validator for a schema.
+
+    Resolves the Pydantic validator once so repeated validations skip
+    schema detection. Callers that validate repeatedly (e.g. ``Evolve``)
+    should build it once and keep it; dataclasses get a new TypeAdapter
+    per call.
+
+    Args:
+        schema: Pydantic model, dataclass, or JSON Schema dict
+
+    Returns:
+        Callable ``(raw_json, strict=...) -> instance`` accepting str or bytes,
+        or None for dict schemas (validated by TS SDK) and no schema
+    """
+    if schema is None or is_json_schema(schema):
+        return None
+
+    if is_pydantic_model(schema):
+        return schema.model_validate_json
+
+    if is_dataclass(schema):
+        from pydantic import TypeAdapter
+        return TypeAdapter(schema).validate_json
+
+    return None
+
+
 def validate_and_parse(
-    raw_json: str,
+    raw_json: Union[str, bytes],
     schema: Any,
     strict: bool = False,
 ) -> Any:
     """Validate JSON string and parse into schema type.
 
+    Parsing and validation happen in a single pydantic-core pass; the input
+    is never routed through stdlib ``json``.
+
     Args:
-        raw_json: Raw JSON string to validate
+        raw_json: Raw JSON (str or UTF-8 bytes) to validate
         schema: Pydantic model or dataclass (returns instance)
         strict: Use strict validation mode
 
@@ -93,15 +140,8 @@ def validate_and_parse(
     Raises:
         ValidationError: If validation fails
     """
-    if schema is None or is_json_schema(schema):
+    validator = build_json_validator(schema)
+    if validator is None:
         # JSON Schema validation is handled by TS SDK
         return None
-
-    if is_pydantic_model(schema):
-        return schema.model_validate_json(raw_json, strict=strict)
-
-    if is_dataclass(schema):
-        from pydantic import TypeAdapter
-        return TypeAdapter(schema).validate_json(raw_json, strict=strict)
-
-    return None
+    return validator(raw_json, strict=strict)
@@ -4,7 +4,7 @@ import asyncio
 from typing import Any, Dict, List, Literal, Optional
 
 from .results import BrowserReplay, SessionEvent, SessionInfo, SessionPage
-from .utils import _filter_none, _require_browser_replay, _require_session_info
+from .utils import _require_browser_replay, _require_session_info
 
 
 class SessionsClient:
@@ -35,6 +35,7 @@ class SessionsClient:
     ):
         self._bridge = bridge
         self._config = sessions_config
+        self._config_dict = sessions_config.to_dict() if sessions_config is not None else None
         self._owns_bridge = _owns_bridge
         self._started = False
         self._init_lock = asyncio.Lock()
@@ -50,9 +51,11 @@ class SessionsClient:
     def _build_params(self, **kwargs: Any) -> Dict[str, Any]:
         """Build RPC params, including standalone sessions config."""
         params: Dict[str, Any] = {}
-        if self._config is not None:
-            params['sessions'] = self._config.to_dict()
-        params.update(_filter_none(kwargs))
+        if self._config_dict is not None:
+            params['sessions'] = self._config_dict
+        for key, value in kwargs.items():
+            if value is not None:
+                params[key] = value
         return params
 
     async def list(
@@ -76,7 +79,7 @@ class SessionsClient:
         )
         response = await self._bridge.call('sessions_list', params)
         return SessionPage(
-            items=[_require_session_info(item) for item in response.get('items', [])],
+            items=list(map(_require_session_info, response.get('items', []))),
             next_cursor=response.get('next_cursor'),
             has_more=bool(response.get('has_more', False)),
         )
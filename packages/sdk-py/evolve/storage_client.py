@@ -4,7 +4,7 @@ import asyncio
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from .results import CheckpointInfo
-from .utils import _decode_files_from_transport, _filter_none, _parse_checkpoint, _require_checkpoint
+from .utils import _decode_files_from_transport, _parse_checkpoint, _require_checkpoint
 
 
 class StorageClient:
@@ -44,7 +44,10 @@ class StorageClient:
         _init_fn: Optional[Callable[[], Awaitable[None]]] = None,
     ):
         self._bridge = bridge
+        self._call = bridge.call  # bound once; every public method is one RPC
         self._config = storage_config  # None = use Evolve's initialized config
+        # Serialized once; the config is fixed for the client's lifetime
+        self._config_dict = storage_config.to_dict() if storage_config is not None else None
         self._owns_bridge = _owns_bridge
         # Readiness callback — in bound mode this triggers Evolve._ensure_initialized
         # so the bridge adapter has a live Evolve instance to delegate to.
@@ -66,9 +69,11 @@ class StorageClient:
     def _build_params(self, **kwargs: Any) -> Dict[str, Any]:
         """Build RPC params, including storage config if in standalone mode."""
         params: Dict[str, Any] = {}
-        if self._config is not None:
-            params['storage'] = self._config.to_dict()
-        params.update(_filter_none(kwargs))
+        if self._config_dict is not None:
+            params['storage'] = self._config_dict
+        for key, value in kwargs.items():
+            if value is not None:
+                params[key] = value
         return params
 
     async def list_checkpoints(
@@ -87,8 +92,8 @@ class StorageClient:
         """
         await self._ensure_ready()
         params = self._build_params(limit=limit, tag=tag)
-        response = await self._bridge.call('storage_list_checkpoints', params)
-        return [_require_checkpoint(cp) for cp in response]
+        response = await self._call('storage_list_checkpoints', params)
+        return list(map(_require_checkpoint, response))
 
     async def get_checkpoint(self, id: str) -> CheckpointInfo:
         """Get checkpoint metadata by ID.
@@ -104,7 +109,7 @@ class StorageClient:
         """
         await self._ensure_ready()
         params = self._build_params(id=id)
-        response = await self._bridge.call('storage_get_checkpoint', params)
+        response = await self._call('storage_get_checkpoint', params)
         return _require_checkpoint(response)
 
     async def download_checkpoint(
@@ -127,7 +132,7 @@ class StorageClient:
         """
         await self._ensure_ready()
         params = self._build_params(id=id, to=to, extract=extract if not extract else None)
-        response = await self._bridge.call('storage_download_checkpoint', params)
+        response = await self._call('storage_download_checkpoint', params)
         return response['path']
 
     async def download_files(
@@ -154,8 +159,45 @@ class StorageClient:
         """
         await self._ensure_ready()
         params = self._build_params(id=id, files=files, glob=glob, to=to)
-        response = await self._bridge.call('storage_download_files', params)
-        return _decode_files_from_transport(response.get('files', {}))
+        response = await self._call('storage_download_files', params)
+        return _decode_files_from_transport(response.get('files', {}), response.get('all_text', False))
+
+    async def download_many(
+        self,
+        ids: List[str],
+        *,
+        files: Optional[List[str]] = None,
+        glob: Optional[List[str]] = None,
+        max_concurrency: int = 8,
+    ) -> Dict[str, Dict[str, Union[str, bytes]]]:
+        """Download the same files from several checkpoints concurrently.
+
+        Args:
+            ids: Checkpoint IDs (e.g., ``[cp.id for cp in await store.list_checkpoints()]``)
+            files: Exact file paths to extract from each checkpoint
+            glob: Glob patterns to match in each checkpoint
+            max_concurrency: Maximum downloads in flight at once, at least 1 (default: 8)
+
+        Returns:
+            Dict mapping checkpoint ID to its :meth:`download_files` result
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            Exception: The first download error, once all downloads have settled
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def download(id: str) -> Dict[str, Union[str, bytes]]:
+            async with semaphore:
+                return await self.download_files(id, files=files, glob=glob)
+
+        results = await asyncio.gather(*(download(id) for id in ids), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return dict(zip(ids, results))
 
     async def close(self) -> None:
         """Close the storage client and release resources.
@@ -122,12 +122,22 @@ class Swarm:
         self.semaphore = asyncio.Semaphore(config.concurrency)
         self.bridge = BridgeManager()
         self._bridge_started = False
+        self._bridge_lock = asyncio.Lock()
+        # Agent init params for tasks without an agent override (the common case)
+        self._base_agent_params = config.agent.to_dict() if config.agent else {}
+        # Sandbox provider params are identical for every task; build the dict once
+        self._sandbox_provider: Optional[Dict[str, Any]] = (
+            {'type': config.sandbox.type, 'config': config.sandbox.config} if config.sandbox else None
+        )
 
     async def _ensure_bridge(self):
-        """Ensure bridge is started."""
-        if not self._bridge_started:
-            await self.bridge.start()
-            self._bridge_started = True
+        """Ensure bridge is started (once, even for concurrent operations)."""
+        if self._bridge_started:
+            return
+        async with self._bridge_lock:
+            if not self._bridge_started:
+                await self.bridge.start()
+                self._bridge_started = True
 
     # =========================================================================
     # PUBLIC API
@@ -730,37 +740,40 @@ class Swarm:
         """Execute a single agent task."""
         instance_id = f"{tag_prefix}-{secrets.token_hex(4)}"
 
-        # Build agent config (merges override with base config)
-        agent_config = self._build_agent_config(agent)
+        # Agent config (optional - TS SDK resolves from env vars); overrides merge with base config
+        if agent is None:
+            agent_params = self._base_agent_params
+        else:
+            agent_params = self._build_agent_config(agent).to_dict()
 
         # Convert schema to JSON Schema
         json_schema = to_json_schema(schema)
 
-        # Build init params with _filter_none to exclude None values
+        # Build init params directly, omitting unset values
         # TS SDK resolves defaults from env vars when not provided
-        init_params = _filter_none({
-            # Agent config (optional - TS SDK resolves from env vars)
-            'agent_type': agent_config.type if agent_config else None,
-            'api_key': agent_config.api_key if agent_config else None,
-            'provider_api_key': agent_config.provider_api_key if agent_config else None,
-            'oauth_token': agent_config.oauth_token if agent_config else None,
-            'provider_base_url': agent_config.provider_base_url if agent_config else None,
-            'model': agent_config.model if agent_config else None,
-            'reasoning_effort': agent_config.reasoning_effort if agent_config else None,
-            # Sandbox (optional - TS SDK auto-resolves from EVOLVE_API_KEY/E2B_API_KEY/DAYTONA_API_KEY)
-            'sandbox_provider': {'type': self.config.sandbox.type, 'config': self.config.sandbox.config} if self.config.sandbox else None,
-            # Other settings
-            'workspace_mode': self.config.workspace_mode,
-            'session_tag_prefix': tag_prefix,
-            'system_prompt': system_prompt,
-            'schema': json_schema,
-            'schema_options': schema_options,
-            'context': _encode_files_for_transport(context) if context else None,
-            'mcp_servers': mcp_servers,
-            'skills': skills,
-            'integrations': integrations.to_dict() if integrations else None,
-            'observability': observability,
-        })
+        init_params: Dict[str, Any] = {**agent_params, 'session_tag_prefix': tag_prefix}
+        # Sandbox (optional - TS SDK auto-resolves from EVOLVE_API_KEY/E2B_API_KEY/DAYTONA_API_KEY)
+        if self._sandbox_provider is not None:
+            init_params['sandbox_provider'] = self._sandbox_provider
+        # Other settings
+        if self.config.workspace_mode is not None:
+            init_params['workspace_mode'] = self.config.workspace_mode
+        if system_prompt is not None:
+            init_params['system_prompt'] = system_prompt
+        if json_schema is not None:
+            init_params['schema'] = json_schema
+        if schema_options is not None:
+            init_params['schema_options'] = schema_options
+        if context:
+            init_params['context'] = _encode_files_for_transport(context)
+        if mcp_servers is not None:
+            init_params['mcp_servers'] = mcp_servers
+        if skills is not None:
+            init_params['skills'] = skills
+        if integrations:
+            init_params['integrations'] = integrations.to_dict()
+        if observability is not None:
+            init_params['observability'] = observability
 
         files: FileMap = {}
         data: Any = None
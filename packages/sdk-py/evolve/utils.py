@@ -1,10 +1,13 @@
 """Shared utilities for Evolve SDK."""
 
-import base64
+import binascii
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+from .results import BrowserReplay, CheckpointInfo, SessionInfo
+
 
 def _filter_none(d: Dict[str, Any]) -> Dict[str, Any]:
     """Filter out None values from a dict. Used for building RPC params."""
@@ -13,23 +16,39 @@ def _filter_none(d: Dict[str, Any]) -> Dict[str, Any]:
 
 def _decode_files_from_transport(
     encoded: Dict[str, Any],
+    all_text: bool = False,
 ) -> Dict[str, Union[str, bytes]]:
     """Decode base64/text encoded files from JSON-RPC bridge transport.
 
-    Counterpart to :func:`_encode_files_for_transport`.
+    Counterpart to :func:`_encode_files_for_transport`. Pass ``all_text=True``
+    when the bridge reports every entry as text to skip per-file checks.
     """
-    decoded: Dict[str, Union[str, bytes]] = {}
-    for name, file_data in encoded.items():
-        content = file_data.get('content', '')
-        encoding = file_data.get('encoding', 'text')
-        if encoding == 'base64':
-            decoded[name] = base64.b64decode(content)
-        else:
-            decoded[name] = content
-    return decoded
-
-
-def _parse_checkpoint(data: Optional[Dict[str, Any]]) -> Optional['CheckpointInfo']:
+    if all_text:
+        return {name: file_data.get('content', '') for name, file_data in encoded.items()}
+    # binascii.a2b_base64 accepts the ASCII str directly; base64.b64decode
+    # would first copy it into a bytes object.
+    return {
+        name: (
+            binascii.a2b_base64(file_data.get('content', ''))
+            if file_data.get('encoding', 'text') == 'base64'
+            else file_data.get('content', '')
+        )
+        for name, file_data in encoded.items()
+    }
+
+
+# CheckpointInfo fields with defaults, forwarded as-is from bridge responses.
+_CHECKPOINT_OPTIONAL_FIELDS = (
+    'size_bytes',
+    'agent_type',
+    'model',
+    'workspace_mode',
+    'parent_id',
+    'comment',
+)
+
+
+def _parse_checkpoint(data: Optional[Dict[str, Any]]) -> Optional[CheckpointInfo]:
     """Parse checkpoint dict from bridge response into CheckpointInfo.
 
     Returns None when *data* is falsy (e.g. ``None`` or ``{}``).
@@ -37,24 +56,18 @@ def _parse_checkpoint(data: Optional[Dict[str, Any]]) -> Optional['CheckpointInf
     """
     if not data:
         return None
-    # Import here to avoid circular import (utils ← results ← utils).
-    # Python caches after first load so subsequent calls are a cheap lookup.
-    from .results import CheckpointInfo  # noqa: E402
+    # Required fields are indexed so a corrupt record raises KeyError;
+    # optional fields are forwarded only when present (unknown keys ignored).
     return CheckpointInfo(
-        id=data['id'],
-        hash=data['hash'],
-        tag=data['tag'],
-        timestamp=data['timestamp'],
-        size_bytes=data.get('size_bytes'),
-        agent_type=data.get('agent_type'),
-        model=data.get('model'),
-        workspace_mode=data.get('workspace_mode'),
-        parent_id=data.get('parent_id'),
-        comment=data.get('comment'),
+        data['id'],
+        data['hash'],
+        data['tag'],
+        data['timestamp'],
+        **{k: data[k] for k in _CHECKPOINT_OPTIONAL_FIELDS if k in data},
     )
 
 
-def _require_checkpoint(data: Optional[Dict[str, Any]]) -> 'CheckpointInfo':
+def _require_checkpoint(data: Optional[Dict[str, Any]]) -> CheckpointInfo:
     """Like :func:`_parse_checkpoint` but raises on falsy *data*.
 
     Use in APIs typed ``-> CheckpointInfo`` where a missing/corrupt
@@ -66,11 +79,10 @@ def _require_checkpoint(data: Optional[Dict[str, Any]]) -> 'CheckpointInfo':
     return result
 
 
-def _parse_session_info(data: Optional[Dict[str, Any]]) -> Optional['SessionInfo']:
+def _parse_session_info(data: Optional[Dict[str, Any]]) -> Optional[SessionInfo]:
     """Parse session dict from bridge response into SessionInfo."""
     if not data:
         return None
-    from .results import SessionInfo  # noqa: E402
     return SessionInfo(
         id=data['id'],
         tag=data['tag'],
@@ -88,7 +100,7 @@ def _parse_session_info(data: Optional[Dict[str, Any]]) -> Optional['SessionInfo
     )
 
 
-def _require_session_info(data: Optional[Dict[str, Any]]) -> 'SessionInfo':
+def _require_session_info(data: Optional[Dict[str, Any]]) -> SessionInfo:
     """Like :func:`_parse_session_info` but raises on falsy *data*."""
     result = _parse_session_info(data)
     if result is None:
@@ -96,11 +108,10 @@ def _require_session_info(data: Optional[Dict[str, Any]]) -> 'SessionInfo':
     return result
 
 
-def _parse_browser_replay(data: Optional[Dict[str, Any]]) -> Optional['BrowserReplay']:
+def _parse_browser_replay(data: Optional[Dict[str, Any]]) -> Optional[BrowserReplay]:
     """Parse browser replay dict from bridge response into BrowserReplay."""
     if not data:
         return None
-    from .results import BrowserReplay  # noqa: E402
     return BrowserReplay(
         session_id=data['session_id'],
         status=data['status'],
@@ -112,7 +123,7 @@ def _parse_browser_replay(data: Optional[Dict[str, Any]]) -> Optional['BrowserRe
     )
 
 
-def _require_browser_replay(data: Optional[Dict[str, Any]]) -> 'BrowserReplay':
+def _require_browser_replay(data: Optional[Dict[str, Any]]) -> BrowserReplay:
     """Like :func:`_parse_browser_replay` but raises on falsy *data*."""
     result = _parse_browser_replay(data)
     if result is None:
@@ -128,16 +139,17 @@ def _encode_files_for_transport(
     Handles both text (str) and binary (bytes) content with appropriate encoding.
     Uses 'content' field consistently for both input and output files.
     """
-    result = {}
-    for name, file_content in files.items():
-        if isinstance(file_content, bytes):
-            result[name] = {
-                'content': base64.b64encode(file_content).decode('utf-8'),
-                'encoding': 'base64'
+    return {
+        name: (
+            {
+                'content': binascii.b2a_base64(content, newline=False).decode('ascii'),
+                'encoding': 'base64',
             }
-        else:
-            result[name] = {'content': file_content, 'encoding': 'text'}
-    return result
+            if isinstance(content, bytes)
+            else {'content': content, 'encoding': 'text'}
+        )
+        for name, content in files.items()
+    }
 
 
 def read_local_dir(local_path: str, recursive: bool = False) -> Dict[str, bytes]:
@@ -150,16 +162,17 @@ def read_local_dir(local_path: str, recursive: bool = False) -> Dict[str, bytes]
     Returns:
         Dict mapping relative paths to file content as bytes
     """
-    result: Dict[str, bytes] = {}
     root = Path(local_path)
 
     paths = root.rglob('*') if recursive else root.iterdir()
+    files = [p for p in paths if p.is_file()]
+    if len(files) <= 1:
+        return {str(p.relative_to(root)): p.read_bytes() for p in files}
 
-    for p in paths:
-        if p.is_file():
-            result[str(p.relative_to(root))] = p.read_bytes()
-
-    return result
+    # Reads release the GIL, so a pool overlaps per-file syscall latency
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(files))) as pool:
+        contents = pool.map(Path.read_bytes, files)
+        return {str(p.relative_to(root)): data for p, data in zip(files, contents)}
 
 
 def save_local_dir(local_path: str, files: Dict[str, Union[str, bytes]]) -> None:
@@ -174,15 +187,15 @@ def save_local_dir(local_path: str, files: Dict[str, Union[str, bytes]]) -> None
         >>> save_local_dir('./output', output.files)
         # Creates: ./output/file.txt, ./output/subdir/nested.txt, etc.
     """
-    for name, content in files.items():
-        file_path = os.path.join(local_path, name)
-        parent = os.path.dirname(file_path)
+    paths = {name: os.path.join(local_path, name) for name in files}
 
-        # Create parent directories if needed
+    # Create each parent directory once instead of once per file
+    for parent in {os.path.dirname(file_path) for file_path in paths.values()}:
         if parent:
             os.makedirs(parent, exist_ok=True)
 
-        # Write content
+    for name, content in files.items():
+        file_path = paths[name]
         if isinstance(content, bytes):
             with open(file_path, 'wb') as f:
                 f.write(content)
@@ -0,0 +1,19 @@
+"""Shared fixtures for integration tests."""
+
+import pytest_asyncio
+
+from tests.utils.agent_config import get_agent_config
+from tests.utils.test_helpers import create_knowledge_evolve
+
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
+async def evolve():
+    """One knowledge-mode Evolve (and E2B sandbox) shared by the whole session.
+
+    For tests that need no special constructor options; tests that do
+    (working_directory, secrets, ...) still create their own instance.
+    The bridge lives on the session loop, so tests using this fixture must
+    be marked ``@pytest.mark.asyncio(loop_scope='session')``.
+    """
+    async with create_knowledge_evolve(get_agent_config()) as shared:
+        yield shared
@@ -16,6 +16,8 @@ from tests.utils.agent_config import (
     get_agent_display_name,
 )
 from tests.utils.test_helpers import (
+    HELLO_PROMPT,
+    RUN_TIMEOUT_MS,
     ProviderName,
     create_sandbox_provider,
     get_available_providers,
@@ -81,8 +83,8 @@ async def test_stdout_event():
             log_info('Running command with stdout listener')
 
             await evolve.run(
-                prompt='Create a hello.txt file inside the output/ folder with content "Hello world!"',
-                timeout_ms=120000,
+                prompt=HELLO_PROMPT,
+                timeout_ms=RUN_TIMEOUT_MS,
             )
 
             log_result(len(stdout_chunks) > 0, f'Received {len(stdout_chunks)} stdout chunk(s)')
@@ -162,8 +164,8 @@ async def test_content_event_callback():
             log_info('Running command with content listener')
 
             await evolve.run(
-                prompt='Create a hello.txt file inside the output/ folder with content "Hello world!"',
-                timeout_ms=120000,
+                prompt=HELLO_PROMPT,
+                timeout_ms=RUN_TIMEOUT_MS,
             )
 
             log_result(len(content_events) > 0, f'Received {len(content_events)} content event(s)')
@@ -219,8 +221,8 @@ async def test_both_content_and_stdout_work():
             log_info('Running with both content and stdout listeners')
 
             await evolve.run(
-                prompt='Create a hello.txt file inside the output/ folder with content "Hello world!"',
-                timeout_ms=120000,
+                prompt=HELLO_PROMPT,
+                timeout_ms=RUN_TIMEOUT_MS,
             )
 
             log_result(len(content_events) > 0, f'Received {len(content_events)} content event(s)')
@@ -259,8 +261,8 @@ async def test_lifecycle_event_callback():
             log_info('Running command with lifecycle listener')
 
             await evolve.run(
-                prompt='Create a hello.txt file inside the output/ folder with content "Hello world!"',
-                timeout_ms=120000,
+                prompt=HELLO_PROMPT,
+                timeout_ms=RUN_TIMEOUT_MS,
             )
 
             log_result(len(lifecycle_events) > 0, f'Received {len(lifecycle_events)} lifecycle event(s)')
@@ -7,7 +7,7 @@ Tests AgentConfig dataclass fields for BYOK support:
 - provider_base_url: Custom provider endpoint
 - api_key: Gateway mode (Evolve)
 
-Tests E2BProvider config dict generation.
+Tests E2B/Daytona/Modal provider config dict generation.
 Tests bridge initialization params mapping.
 
 Note: Actual API key resolution and validation happens in the TS SDK.
@@ -19,7 +19,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from evolve import Evolve
-from evolve.config import AgentConfig, E2BProvider
+from evolve.config import AgentConfig, DaytonaProvider, E2BProvider, ModalProvider
 from evolve.bridge import BridgeManager
 
 
@@ -216,9 +216,38 @@ class TestE2BProvider:
         assert provider.type == 'e2b'
 
 
+class TestProviderConfigKeys:
+    """Daytona/Modal config dicts use bridge (camelCase) keys and skip unset fields."""
+
+    def test_daytona_config_keys(self):
+        provider = DaytonaProvider(api_url='https://daytona.test/api', snapshot_name='snap')
+
+        assert provider.config == {
+            'apiUrl': 'https://daytona.test/api',
+            'defaultTimeoutMs': 3600000,
+            'snapshotName': 'snap',
+        }
+
+    def test_modal_config_keys(self):
+        provider = ModalProvider(token_id='id', token_secret='secret', timeout_ms=0)
+
+        assert provider.config == {'tokenId': 'id', 'tokenSecret': 'secret'}
+
+
 class TestAgentBridgeConfig:
     """Test agent config is properly passed to bridge."""
 
+    def test_agent_config_to_dict_maps_initialize_params(self):
+        """AgentConfig.to_dict emits bridge initialize keys and omits None fields."""
+        config = AgentConfig(type='codex', provider_api_key='openai-key', reasoning_effort='high')
+
+        assert config.to_dict() == {
+            'agent_type': 'codex',
+            'provider_api_key': 'openai-key',
+            'reasoning_effort': 'high',
+        }
+        assert AgentConfig().to_dict() == {}
+
     def test_agent_config_to_dict_gateway_mode(self):
         """Test gateway mode config converts to proper dict for bridge."""
         config = AgentConfig(
@@ -402,6 +431,39 @@ class TestSwarmConfigInheritance:
 
         assert merged_oauth == 'task-level-oauth'
 
+    def test_swarm_base_agent_params_built_once(self):
+        """Swarm precomputes bridge agent params from its base config."""
+        from evolve import Swarm, SwarmConfig
+
+        swarm = Swarm(SwarmConfig(agent=AgentConfig(type='codex', oauth_token='tok')))
+
+        assert swarm._base_agent_params == {'agent_type': 'codex', 'oauth_token': 'tok'}
+        assert Swarm()._base_agent_params == {}
+
+    @pytest.mark.asyncio
+    async def test_swarm_execute_init_params_omit_unset(self):
+        """Swarm._execute sends only configured init params to create_instance."""
+        from unittest.mock import AsyncMock
+        from evolve import Swarm, SwarmConfig
+
+        swarm = Swarm(SwarmConfig(agent=AgentConfig(type='codex'), sandbox=E2BProvider(api_key='k')))
+        swarm.bridge.create_instance = AsyncMock(side_effect=RuntimeError('stop'))
+        swarm.bridge.get_output_on_instance = AsyncMock(return_value={})
+        swarm.bridge.kill_instance = AsyncMock()
+
+        await swarm._execute(
+            {}, 'prompt', None, None, None, None, None, None, None,
+            tag_prefix='t', timeout=1000,
+        )
+
+        _, init_params = swarm.bridge.create_instance.call_args.args
+        assert init_params == {
+            'agent_type': 'codex',
+            'session_tag_prefix': 't',
+            'sandbox_provider': {'type': 'e2b', 'config': {'apiKey': 'k', 'defaultTimeoutMs': 3600000}},
+            'workspace_mode': 'knowledge',
+        }
+
 
 class TestEnvironmentVariableFallback:
     """Test that config with None values allows env var fallback in TS bridge."""
@@ -518,6 +580,22 @@ class TestSessionRuntimeParity:
         assert params['forward_content'] is True
         assert params['forward_lifecycle'] is True
 
+    @pytest.mark.asyncio
+    async def test_initialize_omits_unset_params(self):
+        mock_bridge = MockBridgeManager()
+        with patch('evolve.agent.BridgeManager', return_value=mock_bridge):
+            kit = Evolve(config=AgentConfig(type='codex', model='gpt-5'))
+            await kit._ensure_initialized()
+
+        params = [c for c in mock_bridge.calls if c[0] == 'initialize'][0][1]
+        assert params['agent_type'] == 'codex'
+        assert params['model'] == 'gpt-5'
+        assert params['working_directory'] == '/home/user/workspace'
+        assert params['workspace_mode'] == 'knowledge'
+        for key in ('api_key', 'oauth_token', 'sandbox_provider', 'context', 'schema', 'schema_options', 'storage'):
+            assert key not in params
+        assert None not in params.values()
+
     @pytest.mark.asyncio
     async def test_status_returns_typed_snapshot(self):
         mock_bridge = MockBridgeManager()
@@ -533,6 +611,19 @@ class TestSessionRuntimeParity:
         assert status.timestamp == '2026-02-07T00:00:00.000Z'
         assert status.browser == {'live_url': 'https://dashboard.test/browser/live'}
 
+    def test_status_from_dict_fills_defaults_and_ignores_unknown_keys(self):
+        from evolve.results import SessionStatus
+
+        status = SessionStatus.from_dict({'sandbox_id': 'sb-1', 'has_run': 1, 'future_field': 'x'})
+        assert status == SessionStatus(
+            sandbox_id='sb-1',
+            sandbox='stopped',
+            agent='idle',
+            active_process_id=None,
+            has_run=True,
+            timestamp='',
+        )
+
     @pytest.mark.asyncio
     async def test_interrupt_returns_bool(self):
         mock_bridge = MockBridgeManager()
@@ -1,6 +1,7 @@
 """Unit tests for bridge request/response lifecycle edge cases."""
 
 import asyncio
+import json
 
 import pytest
 
@@ -18,6 +19,12 @@ class _DummyStdin:
 class _DummyProcess:
     def __init__(self):
         self.stdin = _DummyStdin()
+        self.stdout = None
+
+
+def _frame(message) -> bytes:
+    payload = json.dumps(message).encode('utf-8')
+    return len(payload).to_bytes(4, byteorder='big') + payload
 
 
 class TestBridgeTimeoutSafety:
@@ -62,3 +69,43 @@ class TestBridgeTimeoutSafety:
             await task
 
         assert bridge.pending_requests == {}
+
+
+class TestBridgeFrameReader:
+    @pytest.mark.asyncio
+    async def test_reads_frames_split_across_chunks(self):
+        bridge = BridgeManager()
+        bridge.process = _DummyProcess()
+        bridge.process.stdout = reader = asyncio.StreamReader()
+        future = asyncio.get_running_loop().create_future()
+        bridge.pending_requests[1] = future
+        events = []
+        bridge.on('stdout', events.append)
+
+        data = _frame({'jsonrpc': '2.0', 'method': 'event', 'params': {'type': 'stdout', 'data': 'hi'}})
+        data += _frame({'jsonrpc': '2.0', 'id': 1, 'result': {'ok': True}})
+        task = asyncio.create_task(bridge._read_responses())
+        for i in range(0, len(data), 7):
+            reader.feed_data(data[i:i + 7])
+            await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(future, 1) == {'ok': True}
+        assert events == ['hi']
+        reader.feed_eof()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_eof_mid_frame_fails_pending_requests(self):
+        bridge = BridgeManager()
+        bridge.process = _DummyProcess()
+        bridge.process.stdout = reader = asyncio.StreamReader()
+        future = asyncio.get_running_loop().create_future()
+        bridge.pending_requests[1] = future
+
+        reader.feed_data(_frame({'jsonrpc': '2.0', 'id': 1, 'result': None})[:-3])
+        reader.feed_eof()
+        await bridge._read_responses()
+
+        with pytest.raises(BridgeConnectionError, match="terminated"):
+            future.result()
+        assert bridge.pending_requests == {}
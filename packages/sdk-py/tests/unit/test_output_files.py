@@ -0,0 +1,197 @@
+"""
+Unit tests for Evolve.get_output_files() schema handling and schema helpers.
+
+Tests:
+- Pydantic model schema — result.json validated natively in Python
+- Dataclass schema — validated via a TypeAdapter built once per instance
+- Invalid result.json — error + raw_data populated, data stays None
+- JSON Schema dict — data/error/raw_data forwarded from the TS SDK
+- No schema — files only
+- to_json_schema() — generated schemas cached per type
+- build_json_validator() — built once per Evolve, dataclass types not kept alive
+"""
+
+import base64
+from dataclasses import dataclass
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from evolve import Evolve
+
+
+class Score(BaseModel):
+    name: str
+    score: int
+
+
+@dataclass
+class ScoreDC:
+    name: str
+    score: int
+
+
+class MockBridgeManager:
+    """Async bridge mock returning a canned get_output_files response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def start(self):
+        return None
+
+    async def stop(self):
+        return None
+
+    def on(self, event_type, callback):
+        return None
+
+    async def call(self, method, params=None, timeout_s=None):
+        self.calls.append((method, params, timeout_s))
+        if method == 'get_output_files':
+            return self.response
+        return {'status': 'ok'}
+
+
+def _files(result_json=None, binary=False):
+    files = {'notes.txt': {'content': 'hello', 'encoding': 'text'}}
+    if result_json is not None:
+        if binary:
+            files['result.json'] = {
+                'content': base64.b64encode(result_json.encode()).decode(),
+                'encoding': 'base64',
+            }
+        else:
+            files['result.json'] = {'content': result_json, 'encoding': 'text'}
+    return files
+
+
+async def _get_output(response, **kwargs):
+    mock_bridge = MockBridgeManager(response)
+    with patch('evolve.agent.BridgeManager', return_value=mock_bridge):
+        kit = Evolve(**kwargs)
+        return await kit.get_output_files()
+
+
+class TestOutputFilesSchema:
+
+    @pytest.mark.asyncio
+    async def test_pydantic_schema_validates_result_json(self):
+        output = await _get_output(
+            {'files': _files('{"name": "a", "score": 3}')},
+            schema=Score,
+        )
+        assert output.error is None
+        assert output.data == Score(name='a', score=3)
+        assert output.files['notes.txt'] == 'hello'
+
+    @pytest.mark.asyncio
+    async def test_dataclass_schema_validates_binary_result_json(self):
+        output = await _get_output(
+            {'files': _files('{"name": "b", "score": 7}', binary=True)},
+            schema=ScoreDC,
+        )
+        assert output.error is None
+        assert output.data == ScoreDC(name='b', score=7)
+
+    @pytest.mark.asyncio
+    async def test_invalid_result_json_sets_error_and_raw_data(self):
+        output = await _get_output(
+            {'files': _files('{"name": "c"}', binary=True)},
+            schema=Score,
+        )
+        assert output.data is None
+        assert output.error.startswith('Schema validation failed')
+        assert output.raw_data == '{"name": "c"}'
+
+    @pytest.mark.asyncio
+    async def test_missing_result_json_sets_error(self):
+        output = await _get_output({'files': _files()}, schema=Score)
+        assert output.data is None
+        assert output.error == 'Schema provided but agent did not create output/result.json'
+
+    @pytest.mark.asyncio
+    async def test_strict_mode_rejects_coercion(self):
+        from evolve import SchemaOptions
+
+        loose = await _get_output({'files': _files('{"name": "d", "score": "5"}')}, schema=Score)
+        strict = await _get_output(
+            {'files': _files('{"name": "d", "score": "5"}')},
+            schema=Score,
+            schema_options=SchemaOptions(mode='strict'),
+        )
+        assert loose.data == Score(name='d', score=5)
+        assert strict.data is None
+        assert strict.error is not None
+
+    @pytest.mark.asyncio
+    async def test_json_schema_dict_forwards_ts_validation(self):
+        output = await _get_output(
+            {
+                'files': _files('{"x": 1}'),
+                'data': {'x': 1},
+                'error': None,
+                'raw_data': None,
+            },
+            schema={'type': 'object', 'properties': {'x': {'type': 'integer'}}},
+        )
+        assert output.data == {'x': 1}
+        assert output.error is None
+
+    @pytest.mark.asyncio
+    async def test_no_schema_returns_files_only(self):
+        output = await _get_output({'files': _files('{"x": 1}'), 'data': {'x': 1}})
+        assert output.data is None
+        assert output.error is None
+        assert output.raw_data is None
+        assert set(output.files) == {'notes.txt', 'result.json'}
+
+
+class TestJsonSchemaCache:
+
+    def test_generated_schema_cached_per_type(self):
+        from evolve.schema import to_json_schema
+
+        assert to_json_schema(Score) is to_json_schema(Score)
+        assert to_json_schema(ScoreDC) is to_json_schema(ScoreDC)
+        assert to_json_schema(Score)['properties']['score']['type'] == 'integer'
+
+    def test_dict_schema_passed_through(self):
+        from evolve.schema import to_json_schema
+
+        schema = {'type': 'object'}
+        assert to_json_schema(schema) is schema
+
+    @pytest.mark.asyncio
+    async def test_dataclass_validator_built_once_per_instance(self):
+        from evolve.schema import build_json_validator
+
+        mock_bridge = MockBridgeManager({'files': _files('{"name": "e", "score": 1}')})
+        with patch('evolve.agent.BridgeManager', return_value=mock_bridge), \
+                patch('evolve.agent.build_json_validator', wraps=build_json_validator) as build:
+            kit = Evolve(schema=ScoreDC)
+            first = await kit.get_output_files()
+            second = await kit.get_output_files()
+
+        assert build.call_count == 1
+        assert first.data == second.data == ScoreDC(name='e', score=1)
+
+    def test_dataclass_validator_does_not_keep_type_alive(self):
+        import gc
+        import weakref
+        from evolve.schema import build_json_validator, to_json_schema
+
+        @dataclass
+        class LocalDC:
+            value: int
+
+        validator = build_json_validator(LocalDC)
+        assert validator('{"value": 1}') == LocalDC(value=1)
+        to_json_schema(LocalDC)
+
+        type_ref = weakref.ref(LocalDC)
+        del LocalDC, validator
+        gc.collect()
+        assert type_ref() is None
@@ -0,0 +1,32 @@
+"""
+Unit tests for prompt template helpers.
+
+Tests:
+- apply_template() — substitutes known placeholders, leaves unknown ones as-is
+- apply_template() — substituted values are not re-expanded (single pass)
+"""
+
+from evolve.prompts import apply_template
+
+
+# =============================================================================
+# APPLY TEMPLATE
+# =============================================================================
+
+
+class TestApplyTemplate:
+
+    def test_substitutes_every_occurrence(self):
+        assert apply_template('{{a}} and {{a}}, {{b}}', {'a': 'x', 'b': 'y'}) == 'x and x, y'
+
+    def test_unknown_placeholders_left_as_is(self):
+        assert apply_template('{{a}} {{missing}}', {'a': 'x'}) == 'x {{missing}}'
+        assert apply_template('{{a}}', {}) == '{{a}}'
+
+    def test_substituted_values_are_not_re_expanded(self):
+        """A value containing {{name}} is inserted literally, whatever the dict order."""
+        variables = {'criteria': 'Mention {{fileTree}} verbatim', 'fileTree': 'a.py'}
+
+        result = apply_template('{{criteria}}\n{{fileTree}}', variables)
+
+        assert result == 'Mention {{fileTree}} verbatim\na.py'
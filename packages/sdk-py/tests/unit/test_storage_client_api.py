@@ -8,11 +8,14 @@ Tests:
 - StorageClient.get_checkpoint(id) — returns CheckpointInfo with all fields
 - StorageClient.download_checkpoint(id) — returns path, passes options
 - StorageClient.download_files(id) — decodes text + base64, passes filters
+- StorageClient.download_many(ids) — concurrent download_files, bounded in-flight
 - Evolve.storage() — returns StorageClient, raises without config, bound mode
 - Standalone storage() — sync factory, gateway mode, BYOK credentials
 - Context manager — __aenter__/__aexit__, close() safety
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch
 
@@ -312,6 +315,26 @@ class TestStorageClientDownloadFiles:
         # 'aGVsbG8=' is base64 for 'hello'
         assert files['workspace/image.png'] == b'hello'
 
+    @pytest.mark.asyncio
+    async def test_all_text_response(self):
+        """download_files() returns text content as-is when the bridge flags all_text."""
+        client, _ = _make_client()
+
+        async def all_text_call(method, params=None, timeout_s=None):
+            return {
+                'files': {
+                    'workspace/a.py': {'content': 'print(1)', 'encoding': 'text'},
+                    'workspace/b.md': {'content': '# b', 'encoding': 'text'},
+                },
+                'all_text': True,
+            }
+
+        client._call = all_text_call
+
+        files = await client.download_files('cp-123')
+
+        assert files == {'workspace/a.py': 'print(1)', 'workspace/b.md': '# b'}
+
     @pytest.mark.asyncio
     async def test_passes_file_filter(self):
         """download_files(files=[...]) passes files filter."""
@@ -369,6 +392,79 @@ class TestStorageClientDownloadFiles:
         assert 'to' not in params
 
 
+# =============================================================================
+# STORAGE CLIENT — DOWNLOAD MANY
+# =============================================================================
+
+
+class TestStorageClientDownloadMany:
+    """Test StorageClient.download_many()."""
+
+    @pytest.mark.asyncio
+    async def test_returns_files_per_checkpoint(self):
+        """download_many() maps each ID to its decoded files."""
+        client, bridge = _make_client()
+
+        result = await client.download_many(['cp-1', 'cp-2'], glob=['workspace/*.txt'])
+
+        assert list(result) == ['cp-1', 'cp-2']
+        assert result['cp-2']['workspace/data.txt'] == 'hello world'
+        calls = _get_calls(bridge, 'storage_download_files')
+        assert sorted(c[1]['id'] for c in calls) == ['cp-1', 'cp-2']
+        assert all(c[1]['glob'] == ['workspace/*.txt'] for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency(self):
+        """download_many() keeps at most max_concurrency downloads in flight."""
+        client, bridge = _make_client()
+        in_flight = peak = 0
+        original_call = bridge.call
+
+        async def tracking_call(method, params=None, timeout_s=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            try:
+                return await original_call(method, params, timeout_s)
+            finally:
+                in_flight -= 1
+
+        client._call = tracking_call
+
+        await client.download_many([f'cp-{i}' for i in range(6)], max_concurrency=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_max_concurrency_below_one(self):
+        """download_many() raises instead of hanging on a zero-slot semaphore."""
+        client, bridge = _make_client()
+
+        for max_concurrency in (0, -1):
+            with pytest.raises(ValueError, match='max_concurrency must be at least 1'):
+                await client.download_many(['cp-1'], max_concurrency=max_concurrency)
+        assert _get_calls(bridge, 'storage_download_files') == []
+
+    @pytest.mark.asyncio
+    async def test_raises_after_all_settle(self):
+        """A failed download raises once every other download has finished."""
+        client, bridge = _make_client()
+        original_call = bridge.call
+
+        async def failing_call(method, params=None, timeout_s=None):
+            if params.get('id') == 'cp-bad':
+                raise Exception('Checkpoint not found: cp-bad')
+            await asyncio.sleep(0)
+            return await original_call(method, params, timeout_s)
+
+        client._call = failing_call
+
+        with pytest.raises(Exception, match='cp-bad'):
+            await client.download_many(['cp-bad', 'cp-1', 'cp-2'])
+        assert len(_get_calls(bridge, 'storage_download_files')) == 2
+
+
 # =============================================================================
 # EVOLVE.STORAGE() ACCESSOR
 # =============================================================================
@@ -449,6 +545,20 @@ class TestStandaloneStorage:
         assert 'storage' in params
         assert params['storage'] == {'url': 's3://bucket/'}
 
+    @pytest.mark.asyncio
+    async def test_storage_config_serialized_once(self):
+        """Standalone StorageClient serializes its config once, not per call."""
+        bridge = MockBridgeManager()
+        config = StorageConfig(url='s3://bucket/')
+        client = StorageClient(bridge, config, _owns_bridge=True)
+
+        with patch.object(StorageConfig, 'to_dict', side_effect=AssertionError('re-serialized')):
+            await client.list_checkpoints()
+            await client.get_checkpoint('ckpt_1')
+
+        calls = _get_calls(bridge, 'storage_list_checkpoints') + _get_calls(bridge, 'storage_get_checkpoint')
+        assert [c[1]['storage'] for c in calls] == [{'url': 's3://bucket/'}] * 2
+
     @pytest.mark.asyncio
     async def test_gateway_mode(self):
         """storage() with no args uses gateway mode (empty storage config)."""
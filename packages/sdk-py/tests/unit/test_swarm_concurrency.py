@@ -862,6 +862,24 @@ async def test_high_load_best_of() -> None:
     assert_test(tracker.max_concurrent == 4, f"Max concurrent was {tracker.max_concurrent}, expected 4")
 
 
+async def test_concurrent_operations_start_bridge_once() -> None:
+    print("\n[24] Concurrent operations share a single bridge start")
+
+    swarm = Swarm(SwarmConfig(tag="test"))
+    starts = 0
+
+    async def mock_start() -> None:
+        nonlocal starts
+        starts += 1
+        await sleep_ms(10)
+
+    swarm.bridge.start = mock_start
+
+    await asyncio.gather(*(swarm._ensure_bridge() for _ in range(5)))
+
+    assert_test(starts == 1, f"Bridge started {starts} times, expected 1")
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -884,6 +902,7 @@ async def main() -> None:
     await test_map_best_of_filter_reduce()
     await test_concurrency_never_exceeded()
     await test_high_load_best_of()
+    await test_concurrent_operations_start_bridge_once()
 
     # Retry tests
     await test_map_retry_basic()
@@ -3,10 +3,11 @@
 import os
 import json
 import asyncio
+import functools
 from typing import Any, Optional, Literal, List
 from pathlib import Path
 from dotenv import load_dotenv
-from evolve import E2BProvider, DaytonaProvider, ModalProvider, SandboxProvider
+from evolve import AgentConfig, DaytonaProvider, E2BProvider, Evolve, ModalProvider, SandboxProvider
 
 # Load .env from workspace root
 root_dir = Path(__file__).parent.parent.parent.parent.parent
@@ -15,8 +16,9 @@ if env_file.exists():
     load_dotenv(env_file)
 
 
+@functools.lru_cache(maxsize=1)
 def get_e2b_api_key() -> str:
-    """Get E2B API key from environment.
+    """Get E2B API key from environment (resolved once per process).
 
     Returns:
         str: E2B API key
@@ -45,8 +47,13 @@ def get_available_providers() -> List[ProviderName]:
     return available
 
 
+@functools.lru_cache(maxsize=None)
 def create_sandbox_provider(provider: ProviderName) -> SandboxProvider:
-    """Create sandbox provider from env-based configuration."""
+    """Create sandbox provider from env-based configuration.
+
+    Built once per provider name; providers are read-only config, so the
+    instance is shared by every Evolve in the process.
+    """
     if provider == 'e2b':
         return E2BProvider(api_key=get_e2b_api_key())
 
@@ -75,6 +82,16 @@ def create_sandbox_provider(provider: ProviderName) -> SandboxProvider:
     raise ValueError(f'Unsupported provider: {provider}')
 
 
+def create_knowledge_evolve(config: Optional[AgentConfig], **kwargs: Any) -> Evolve:
+    """Create a knowledge-mode Evolve on E2B; enter it with ``async with``."""
+    return Evolve(
+        config=config,
+        sandbox=create_sandbox_provider('e2b'),
+        workspace_mode='knowledge',
+        **kwargs,
+    )
+
+
 def supports_pause_resume(provider: ProviderName) -> bool:
     """Whether provider supports pause/resume."""
     return provider != 'modal'
@@ -85,6 +102,17 @@ def supports_interrupt(provider: ProviderName) -> bool:
     return provider != 'modal'
 
 
+# Trivial agent task used wherever a test just needs one successful run()
+HELLO_PROMPT = 'Create a hello.txt file inside the output/ folder with content "Hello world!"'
+
+# Agent run() timeout; set EVOLVE_TEST_RUN_TIMEOUT_MS lower to fail fast on hung agents
+RUN_TIMEOUT_MS = int(os.getenv('EVOLVE_TEST_RUN_TIMEOUT_MS', '120000'))
+
+
+# EVOLVE_TEST_QUIET=1 silences passing log_result/log_info output (e.g. in CI)
+QUIET = bool(os.getenv('EVOLVE_TEST_QUIET'))
+
+
 def log_section(title: str) -> None:
     """Log test section header.
 
@@ -104,6 +132,8 @@ def log_result(success: bool, message: str, details: Any = None) -> None:
         message: Result message
         details: Optional details (string or object)
     """
+    if success and QUIET:
+        return
     icon = '✅' if success else '❌'
     print(f'{icon} {message}')
     if details:
@@ -119,6 +149,8 @@ def log_info(message: str) -> None:
     Args:
         message: Info message
     """
+    if QUIET:
+        return
     print(f'ℹ️  {message}')
 
 
@@ -136,6 +168,20 @@ def assert_true(condition: bool, message: str) -> None:
         raise AssertionError(f'Assertion failed: {message}')
 
 
+def check(condition: bool, message: str) -> None:
+    """Log a check result and assert it, in one call.
+
+    Args:
+        condition: Condition to check
+        message: Result message, logged and used as the error message
+
+    Raises:
+        AssertionError: If condition is False
+    """
+    log_result(condition, message)
+    assert_true(condition, message)
+
+
 async def sleep(ms: int) -> None:
     """Sleep for specified milliseconds.
 